@@ -9,8 +9,13 @@ https://docs.djangoproject.com/en/4.1/howto/deployment/asgi/
 
 import os
 
+from django.conf import settings
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'TimeTracker.settings')
 
 application = get_asgi_application()
+
+if settings.WARMUP_ON_BOOT:
+    from timelogs.warmup import warm_up
+    warm_up(database=False)
@@ -14,6 +14,8 @@ import os
 from pathlib import Path
 from dotenv import load_dotenv
 from datetime import timedelta
+from decimal import Decimal
+from django.core.exceptions import ImproperlyConfigured
 
 #loading env variables
 load_dotenv()
@@ -84,9 +86,46 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # Seconds to keep a connection open between requests (0 closes it after every request)
+        'CONN_MAX_AGE': int(os.environ.get('CONN_MAX_AGE', 0)),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
+# Run timelogs.warmup.warm_up() when a WSGI/ASGI worker boots
+WARMUP_ON_BOOT = os.environ.get('WARMUP_ON_BOOT', '').lower() in ('1', 'true', 'yes')
+
+
+# Cache and sessions
+# https://docs.djangoproject.com/en/4.1/topics/http/sessions/#configuring-the-session-engine
+
+# locmem is private to each worker process; use redis or memcached when running several workers
+CACHE_BACKENDS = {
+    'locmem': 'django.core.cache.backends.locmem.LocMemCache',
+    'redis': 'django.core.cache.backends.redis.RedisCache',
+    'memcached': 'django.core.cache.backends.memcached.PyMemcacheCache',
+}
+CACHE_BACKEND = os.environ.get('CACHE_BACKEND', 'locmem')
+if CACHE_BACKEND not in CACHE_BACKENDS:
+    raise ImproperlyConfigured(f'CACHE_BACKEND must be one of {", ".join(CACHE_BACKENDS)}')
+
+CACHES = {
+    'default': {
+        'BACKEND': CACHE_BACKENDS[CACHE_BACKEND],
+        'LOCATION': os.environ.get('CACHE_LOCATION', ''),
+    }
+}
+
+# db, cached_db, signed_cookies or cache. cached_db and cache need a shared CACHE_BACKEND,
+# otherwise a logout on one worker leaves the session alive in the other workers' caches
+SESSION_BACKENDS = ['db', 'cached_db', 'signed_cookies', 'cache']
+SESSION_BACKEND = os.environ.get('SESSION_BACKEND', 'db' if CACHE_BACKEND == 'locmem' else 'cached_db')
+if SESSION_BACKEND not in SESSION_BACKENDS:
+    raise ImproperlyConfigured(f'SESSION_BACKEND must be one of {", ".join(SESSION_BACKENDS)}')
+if SESSION_BACKEND in ('cached_db', 'cache') and CACHE_BACKEND == 'locmem':
+    raise ImproperlyConfigured(f'SESSION_BACKEND={SESSION_BACKEND} needs CACHE_BACKEND set to redis or memcached')
+SESSION_ENGINE = f'django.contrib.sessions.backends.{SESSION_BACKEND}'
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.1/ref/settings/#auth-password-validators
@@ -136,4 +175,7 @@ REST_FRAMEWORK = {
     ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.LimitOffsetPagination',
     'PAGE_SIZE': 100
-}
\ No newline at end of file
+}
+
+# Maximum number of hours a user can log for a single day
+TIMELOG_MAX_HOURS_PER_DAY = Decimal(os.environ.get('TIMELOG_MAX_HOURS_PER_DAY', '24'))
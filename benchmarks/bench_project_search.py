@@ -0,0 +1,71 @@
+"""
+Benchmark project search latency on a large Project catalog.
+
+Compares downloading the whole catalog (what the project picker does today) with
+the FTS5-backed search used on SQLite and the istartswith fallback used on other backends.
+
+Usage:
+python benchmarks/bench_project_search.py [catalog_size]
+"""
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'TimeTracker.settings')
+
+import django
+django.setup()
+
+from django.db import connection
+from django.test.utils import setup_test_environment
+from timelogs.models import Project
+from timelogs.search import ProjectSearchResults, fallback_search_projects
+from timelogs.serializers import ProjectSerializer
+
+WORDS = ['billing', 'payroll', 'timesheet', 'mobile', 'portal', 'migration', 'analytics', 'support']
+QUERIES = ['P12', 'pay', 'timesheet portal', 'analytics mig']
+PAGE_SIZE = 20
+RUNS = 20
+
+
+def timed(func):
+    start = time.perf_counter()
+    for _ in range(RUNS):
+        func()
+    return (time.perf_counter() - start) / RUNS * 1000
+
+
+def main():
+    catalog_size = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        Project.objects.bulk_create(
+            (
+                Project(
+                    name=f'{WORDS[i % len(WORDS)].title()} {WORDS[i // 7 % len(WORDS)]} {i}',
+                    description=f'{WORDS[i // 3 % len(WORDS)]} work for customer {i} ' + 'x' * 400,
+                    project_id=f'P{i}',
+                )
+                for i in range(catalog_size)
+            ),
+            batch_size=5000,
+        )
+        print(f'{catalog_size} projects, {PAGE_SIZE} results per page, mean of {RUNS} runs')
+        full_catalog = timed(lambda: ProjectSerializer(Project.objects.all(), many=True).data)
+        print(f'{"full catalog download":<40}{full_catalog:>10.2f} ms')
+        for query in QUERIES:
+            fts = timed(lambda: (ProjectSearchResults(query).count(), ProjectSearchResults(query)[0:PAGE_SIZE]))
+            fallback = timed(lambda: (
+                fallback_search_projects(query).count(), list(fallback_search_projects(query)[0:PAGE_SIZE])
+            ))
+            print(f'{"fts5 " + repr(query):<40}{fts:>10.2f} ms')
+            print(f'{"istartswith " + repr(query):<40}{fallback:>10.2f} ms')
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark per-request latency and DB queries of session-authenticated /track/ calls.
+
+Compares the session backends selectable with SESSION_BACKEND.
+
+Usage:
+python benchmarks/bench_track_requests.py [requests_per_backend]
+"""
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'TimeTracker.settings')
+
+import django
+django.setup()
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext, setup_test_environment
+from timelogs.models import Project
+
+# The benchmark runs in one process, so the locmem cache stands in for the shared redis/memcached cache
+PROFILES = [
+    ('db', 'django.contrib.sessions.backends.db'),
+    ('cached_db', 'django.contrib.sessions.backends.cached_db'),
+    ('signed_cookies', 'django.contrib.sessions.backends.signed_cookies'),
+]
+
+
+def run_profile(user, session_engine, requests):
+    with override_settings(SESSION_ENGINE=session_engine):
+        client = Client()
+        client.force_login(user)
+        client.get('/track/project')
+        with CaptureQueriesContext(connection) as queries:
+            start = time.perf_counter()
+            for _ in range(requests):
+                client.get('/track/project')
+            elapsed = time.perf_counter() - start
+    return elapsed / requests * 1000, len(queries) / requests
+
+
+def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        user = User.objects.create_user(username='benchuser', password='benchpass')
+        Project.objects.bulk_create(
+            Project(name=f'Project {i}', description='Benchmark project', project_id=f'B{i}')
+            for i in range(20)
+        )
+        print(f'{requests} GET /track/project requests per session backend')
+        print(f'{"session backend":<42}{"ms/request":>12}{"queries/request":>18}')
+        for name, session_engine in PROFILES:
+            latency, queries = run_profile(user, session_engine, requests)
+            print(f'{name:<42}{latency:>12.3f}{queries:>18.2f}')
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == '__main__':
+    main()
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class TimelogsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'timelogs'
+
+    def ready(self):
+        from . import signals
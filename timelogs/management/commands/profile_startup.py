@@ -0,0 +1,80 @@
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Runs in a fresh interpreter so nothing is already imported
+BOOT_SCRIPT = """
+import json, time
+start = time.perf_counter()
+from django.core.wsgi import get_wsgi_application
+get_wsgi_application()
+timings = {'boot': time.perf_counter() - start}
+if %(warmup)r:
+    from timelogs.warmup import warm_up
+    timings.update(warm_up())
+print(json.dumps(timings))
+"""
+
+
+def parse_import_times(output):
+    """
+    Parses `python -X importtime` output into (module, self_us, cumulative_us) rows
+    """
+    rows = []
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        self_us, cumulative_us, module = line[len('import time:'):].split('|')
+        rows.append((module.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+class Command(BaseCommand):
+    """
+    Boots the WSGI application in a fresh interpreter and reports where the cold start time goes:
+    import time per top-level package, the slowest modules and the boot and warm-up durations.
+    Run it after dependency or settings changes to catch cold-start regressions.
+    The database warm-up steps need a migrated database; against a missing one they are reported as FAILED.
+    """
+    help = 'Report import time by module and worker boot time for the WSGI application'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, default=15, help='Number of packages and modules to list')
+        parser.add_argument('--warmup', action='store_true', help='Also time each worker warm-up step')
+
+    def handle(self, *args, **options):
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', BOOT_SCRIPT % {'warmup': options['warmup']}],
+            cwd=settings.BASE_DIR,
+            env={**os.environ, 'WARMUP_ON_BOOT': ''},
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            raise CommandError(f'Application failed to boot:\n{result.stderr[-2000:]}')
+        timings = json.loads(result.stdout.strip().splitlines()[-1])
+        imports = parse_import_times(result.stderr)
+        limit = options['limit']
+
+        packages = defaultdict(int)
+        for module, self_us, cumulative_us in imports:
+            packages[module.split('.')[0]] += self_us
+        total_us = sum(packages.values())
+
+        self.stdout.write(f'Imported {len(imports)} modules in {total_us / 1000:.1f} ms')
+        self.stdout.write('\nImport time by package (self):')
+        for package, self_us in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:limit]:
+            self.stdout.write(f'  {package:<40}{self_us / 1000:>10.1f} ms')
+        self.stdout.write('\nSlowest modules (cumulative):')
+        for module, self_us, cumulative_us in sorted(imports, key=lambda row: row[2], reverse=True)[:limit]:
+            self.stdout.write(f'  {module:<40}{cumulative_us / 1000:>10.1f} ms')
+        self.stdout.write('\nBoot time:')
+        for name, seconds in timings.items():
+            if seconds is None:
+                self.stdout.write(self.style.ERROR(f'  {name:<40}{"FAILED":>13}'))
+            else:
+                self.stdout.write(f'  {name:<40}{seconds * 1000:>10.1f} ms')
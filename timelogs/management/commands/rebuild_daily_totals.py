@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from timelogs.models import Timelog, DailyTimelogTotal
+from timelogs.utils import daily_centihours
+
+
+class Command(BaseCommand):
+    """
+    Rebuilds the DailyTimelogTotal table from the raw Timelog rows.
+    Use it to repair the totals after timelogs were written without the serializer (bulk_create, queryset.update(), raw SQL).
+    """
+    help = 'Rebuild per-user daily hour totals from the Timelog table'
+
+    def handle(self, *args, **options):
+        rows = daily_centihours(Timelog.objects.all())
+        with transaction.atomic():
+            DailyTimelogTotal.objects.all().delete()
+            totals = DailyTimelogTotal.objects.bulk_create(
+                DailyTimelogTotal(user_id=row['user_id'], date=row['date'], total_centihours=row['total'])
+                for row in rows
+            )
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {len(totals)} daily totals'))
@@ -0,0 +1,18 @@
+# Generated by Django 4.1.7 on 2026-10-19 11:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('timelogs', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='timelog',
+            name='work_hours',
+            field=models.DecimalField(decimal_places=2, max_digits=5),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 4.1.7 on 2026-10-19 11:50
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+from django.db.models import F, Sum
+from django.db.models.functions import Cast, Round
+
+
+def populate_daily_totals(apps, schema_editor):
+    Timelog = apps.get_model('timelogs', 'Timelog')
+    DailyTimelogTotal = apps.get_model('timelogs', 'DailyTimelogTotal')
+    # Totals are kept in hundredths of an hour, rounded per row (SQLite stores work_hours as REAL)
+    rows = Timelog.objects.values('user_id', 'date').annotate(
+        total=Sum(Cast(Round(F('work_hours') * 100), models.IntegerField()))
+    )
+    DailyTimelogTotal.objects.bulk_create(
+        DailyTimelogTotal(user_id=row['user_id'], date=row['date'], total_centihours=row['total'])
+        for row in rows
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('timelogs', '0002_alter_timelog_work_hours'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyTimelogTotal',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.CharField(max_length=8)),
+                ('total_centihours', models.IntegerField(default=0)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='dailytimelogtotal',
+            constraint=models.UniqueConstraint(fields=('user', 'date'), name='unique_daily_total_per_user'),
+        ),
+        migrations.RunPython(populate_daily_totals, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,84 @@
+# Generated by Django 4.1.7 on 2026-10-19 11:52
+
+from django.db import migrations
+
+# Per-backend search structures, formatted with the Project table name.
+# SQLite: a NOCASE index so `project_id LIKE 'x%'` is an index range scan, and an
+# external-content FTS5 table over name/description kept in sync by triggers.
+# Django remakes the table on most AlterField operations on SQLite, which drops these
+# triggers; ProjectSearchTestCase checks they still exist.
+# PostgreSQL: istartswith compiles to UPPER(col::text) LIKE UPPER(%s), so index that expression
+# with text_pattern_ops. MySQL: istartswith is a plain LIKE under a case-insensitive collation,
+# so a B-tree on name is enough (project_id already has its unique index).
+PROJECT_SEARCH_SQL = {
+    'sqlite': (
+        [
+            "CREATE INDEX {table}_project_id_nocase ON {table}(project_id COLLATE NOCASE)",
+            """CREATE VIRTUAL TABLE {table}_fts USING fts5(
+                name, description, content='{table}', content_rowid='id', prefix='2 3'
+            )""",
+            """CREATE TRIGGER {table}_fts_insert AFTER INSERT ON {table} BEGIN
+                INSERT INTO {table}_fts(rowid, name, description) VALUES (new.id, new.name, new.description);
+            END""",
+            """CREATE TRIGGER {table}_fts_delete AFTER DELETE ON {table} BEGIN
+                INSERT INTO {table}_fts({table}_fts, rowid, name, description)
+                VALUES ('delete', old.id, old.name, old.description);
+            END""",
+            """CREATE TRIGGER {table}_fts_update AFTER UPDATE ON {table} BEGIN
+                INSERT INTO {table}_fts({table}_fts, rowid, name, description)
+                VALUES ('delete', old.id, old.name, old.description);
+                INSERT INTO {table}_fts(rowid, name, description) VALUES (new.id, new.name, new.description);
+            END""",
+            "INSERT INTO {table}_fts({table}_fts) VALUES ('rebuild')",
+        ],
+        [
+            "DROP TRIGGER IF EXISTS {table}_fts_update",
+            "DROP TRIGGER IF EXISTS {table}_fts_delete",
+            "DROP TRIGGER IF EXISTS {table}_fts_insert",
+            "DROP TABLE IF EXISTS {table}_fts",
+            "DROP INDEX IF EXISTS {table}_project_id_nocase",
+        ],
+    ),
+    'postgresql': (
+        [
+            "CREATE INDEX {table}_name_upper ON {table} (UPPER(name::text) text_pattern_ops)",
+            "CREATE INDEX {table}_project_id_upper ON {table} (UPPER(project_id::text) text_pattern_ops)",
+        ],
+        [
+            "DROP INDEX IF EXISTS {table}_project_id_upper",
+            "DROP INDEX IF EXISTS {table}_name_upper",
+        ],
+    ),
+    'mysql': (
+        ["CREATE INDEX {table}_name ON {table} (name)"],
+        ["DROP INDEX {table}_name ON {table}"],
+    ),
+}
+
+
+def run_project_search_sql(apps, schema_editor, reverse=False):
+    statements = PROJECT_SEARCH_SQL.get(schema_editor.connection.vendor)
+    if statements is None:
+        return
+    table = apps.get_model('timelogs', 'Project')._meta.db_table
+    for sql in statements[reverse]:
+        schema_editor.execute(sql.format(table=table))
+
+
+def create_project_search(apps, schema_editor):
+    run_project_search_sql(apps, schema_editor)
+
+
+def drop_project_search(apps, schema_editor):
+    run_project_search_sql(apps, schema_editor, reverse=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('timelogs', '0003_daily_timelog_total'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_project_search, drop_project_search),
+    ]
@@ -1,3 +1,4 @@
+from decimal import Decimal
 from django.db import models
 from django.contrib.auth.models import User
 
@@ -17,3 +18,23 @@ class Timelog(models.Model):
 class UserProfile(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE)
     project = models.ForeignKey(Project, on_delete=models.CASCADE)
+
+class DailyTimelogTotal(models.Model):
+    """
+    Running total of work_hours per user per day, kept in step with Timelog writes
+    so the daily hours cap can be checked with a single row lookup.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    date = models.CharField(max_length=8) #Date format is YYYYMMDD
+    # Hundredths of an hour. An integer keeps the running F() sums exact on SQLite,
+    # which stores DecimalField as REAL
+    total_centihours = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'date'], name='unique_daily_total_per_user'),
+        ]
+
+    @property
+    def total_hours(self):
+        return Decimal(self.total_centihours) / 100
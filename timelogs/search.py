@@ -0,0 +1,83 @@
+import re
+from django.db import connection
+from django.db.models import Case, IntegerField, Q, Value, When
+from .models import Project
+
+PROJECT_TABLE = Project._meta.db_table
+PROJECT_FTS_TABLE = f'{PROJECT_TABLE}_fts'
+
+# Prefix hits on project_id rank ahead of every full-text hit (bm25 scores are small negative numbers)
+PROJECT_ID_PREFIX_RANK = -1e9
+
+SEARCH_SQL = f"""
+    WITH matches(id, rank) AS (
+        SELECT id, {PROJECT_ID_PREFIX_RANK} FROM {PROJECT_TABLE} WHERE project_id LIKE %s ESCAPE '\\'
+        UNION ALL
+        SELECT rowid, bm25({PROJECT_FTS_TABLE}) FROM {PROJECT_FTS_TABLE} WHERE {PROJECT_FTS_TABLE} MATCH %s
+    )
+"""
+
+COUNT_SQL = f"""
+    SELECT COUNT(*) FROM (
+        SELECT id FROM {PROJECT_TABLE} WHERE project_id LIKE %s ESCAPE '\\'
+        UNION
+        SELECT rowid FROM {PROJECT_FTS_TABLE} WHERE {PROJECT_FTS_TABLE} MATCH %s
+    )
+"""
+
+
+def like_prefix(query):
+    return query.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+
+
+def fts_prefix_query(query):
+    """
+    Turns free text into an FTS5 query that prefix-matches every word, e.g. 'time tra' -> '"time"* "tra"*'
+    """
+    return ' '.join(f'"{word}"*' for word in re.findall(r'\w+', query))
+
+
+class ProjectSearchResults:
+    """
+    Ranked project search on SQLite, backed by the PROJECT_FTS_TABLE FTS5 table.
+    Supports count() and slicing so it can be paginated like a queryset.
+    """
+    def __init__(self, query):
+        self.params = [like_prefix(query), fts_prefix_query(query) or '""']
+
+    def count(self):
+        with connection.cursor() as cursor:
+            cursor.execute(COUNT_SQL, self.params)
+            return cursor.fetchone()[0]
+
+    def __getitem__(self, page):
+        limit = page.stop - page.start
+        with connection.cursor() as cursor:
+            cursor.execute(
+                SEARCH_SQL + 'SELECT id FROM matches GROUP BY id ORDER BY MIN(rank), id LIMIT %s OFFSET %s',
+                self.params + [limit, page.start],
+            )
+            ids = [row[0] for row in cursor.fetchall()]
+        projects = Project.objects.in_bulk(ids)
+        return [projects[id] for id in ids if id in projects]
+
+
+def fallback_search_projects(query):
+    """
+    Prefix search on project_id and name for backends without FTS5,
+    served by the per-backend indexes created in migration 0004
+    """
+    return Project.objects.filter(
+        Q(project_id__istartswith=query) | Q(name__istartswith=query)
+    ).annotate(
+        rank=Case(When(project_id__istartswith=query, then=Value(0)), default=Value(1), output_field=IntegerField())
+    ).order_by('rank', 'project_id')
+
+
+def search_projects(query):
+    """
+    Returns projects whose project_id starts with the query or whose name/description match it, best match first
+    """
+    if connection.vendor == 'sqlite':
+        return ProjectSearchResults(query)
+    return fallback_search_projects(query)
@@ -1,5 +1,10 @@
+from decimal import Decimal
+from django.db import transaction
 from rest_framework import serializers
 from .models import Project, Timelog, UserProfile
+from .utils import add_daily_hours, remove_daily_hours
+
+RESERVED_PROJECT_IDS = {'search'}
 
 class ProjectSerializer(serializers.ModelSerializer):
     class Meta:
@@ -10,6 +15,12 @@ class ProjectSerializer(serializers.ModelSerializer):
     description = serializers.CharField(max_length=500)
     project_id = serializers.CharField(max_length=25)
 
+    def validate_project_id(self, value):
+        # /track/project/search is the search endpoint, so a project with this ID could not be reached
+        if value.lower() in RESERVED_PROJECT_IDS:
+            raise serializers.ValidationError(f'{value} is a reserved project ID')
+        return value
+
     def create(self, validated_data):
         return Project.objects.create(**validated_data)
     
@@ -24,16 +35,25 @@ class TimelogSerializer(serializers.ModelSerializer):
     class Meta:
         model = Timelog
         fields = ["work_hours", "project", "user", "date"]
-    
+
+    work_hours = serializers.DecimalField(max_digits=5, decimal_places=2, min_value=Decimal('0.01'))
+
     def create(self, validated_data):
-        return Timelog.objects.create(**validated_data)
+        with transaction.atomic():
+            timelog = Timelog.objects.create(**validated_data)
+            add_daily_hours(timelog.user_id, timelog.date, timelog.work_hours)
+        return timelog
     
     def update(self, instance, validated_data):
-        instance.work_hours = validated_data.get("work_hours", instance.work_hours)
-        instance.project = validated_data.get("project", instance.project)
-        instance.user = validated_data.get("user", instance.user)
-        instance.date = validated_data.get("date", instance.date)
-        instance.save()
+        with transaction.atomic():
+            logged = Timelog.objects.select_for_update().get(pk=instance.pk)
+            remove_daily_hours(logged.user_id, logged.date, logged.work_hours)
+            instance.work_hours = validated_data.get("work_hours", instance.work_hours)
+            instance.project = validated_data.get("project", instance.project)
+            instance.user = validated_data.get("user", instance.user)
+            instance.date = validated_data.get("date", instance.date)
+            instance.save()
+            add_daily_hours(instance.user_id, instance.date, instance.work_hours)
         return instance
 
 class UserProfileSerializer(serializers.ModelSerializer):
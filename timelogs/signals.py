@@ -0,0 +1,12 @@
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+from .models import Timelog
+from .utils import remove_daily_hours
+
+
+@receiver(post_delete, sender=Timelog)
+def remove_deleted_timelog_hours(sender, instance, **kwargs):
+    """
+    Keeps DailyTimelogTotal in step with every Timelog delete, including cascades from Project and User deletes
+    """
+    remove_daily_hours(instance.user_id, instance.date, instance.work_hours)
@@ -1,9 +1,21 @@
+import os
+import tempfile
+from decimal import Decimal
+from io import StringIO
+from unittest import mock, skipUnless
+from django.core.management import call_command
+from django.db import DatabaseError, connection
+from django.test import override_settings
 from django.urls import reverse
+from rest_framework.exceptions import ValidationError
 from rest_framework.test import APITestCase, APIClient
 from rest_framework.views import status
 from django.contrib.auth.models import User
-from .models import UserProfile, Project, Timelog
+from .models import UserProfile, Project, Timelog, DailyTimelogTotal
+from .search import fallback_search_projects
 from .serializers import ProjectSerializer, TimelogSerializer
+from .warmup import check_database, warm_up
+from .management.commands.profile_startup import parse_import_times
 
 class TimelogViewTestCase(APITestCase):
     client = APIClient()
@@ -156,4 +168,223 @@ class TimelogDetailDeleteTestCase(APITestCase):
         url = reverse('timelog-detail', kwargs={'pk': self.timelog.id})
         response = self.client.delete(url)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
-        self.assertTrue(Timelog.objects.filter(id=self.timelog.id).exists())
\ No newline at end of file
+        self.assertTrue(Timelog.objects.filter(id=self.timelog.id).exists())
+
+class DailyHoursCapTestCase(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='capuser', password='testpass')
+        self.project = Project.objects.create(
+            project_id='CAP001', name='Cap Project', description='Cap Project')
+
+    def _create(self, work_hours, date='20231028'):
+        serializer = TimelogSerializer(data={
+            'user': self.user.id, 'project': self.project.id,
+            'date': date, 'work_hours': work_hours,
+        })
+        serializer.is_valid(raise_exception=True)
+        return serializer.save()
+
+    def _total(self, date='20231028'):
+        return DailyTimelogTotal.objects.get(user=self.user, date=date).total_hours
+
+    @override_settings(TIMELOG_MAX_HOURS_PER_DAY=8)
+    def test_create_tracks_total_and_enforces_cap(self):
+        self._create('5.00')
+        self._create('3.00')
+        self.assertEqual(self._total(), Decimal('8.00'))
+        with self.assertRaises(ValidationError):
+            self._create('0.50')
+        self.assertEqual(Timelog.objects.count(), 2)
+        self.assertEqual(self._total(), Decimal('8.00'))
+
+    @override_settings(TIMELOG_MAX_HOURS_PER_DAY=8)
+    def test_view_reports_cap_as_field_error(self):
+        UserProfile.objects.create(user=self.user, project=self.project)
+        self._create('8.00')
+        self.client.force_login(self.user)
+        data = {'user': self.user.id, 'project': self.project.id, 'date': '20231028', 'work_hours': '1.00'}
+        response = self.client.post(reverse('timelogs'), data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['error'], {'work_hours': ['User cannot log more than 8 hours on 20231028']})
+        self.assertEqual(Timelog.objects.count(), 1)
+
+    @override_settings(TIMELOG_MAX_HOURS_PER_DAY=Decimal('7.5'))
+    def test_fractional_cap(self):
+        self._create('7.50')
+        with self.assertRaises(ValidationError):
+            self._create('0.01')
+
+    @override_settings(TIMELOG_MAX_HOURS_PER_DAY=8)
+    def test_fractional_hours_do_not_drift(self):
+        first = self._create('0.10')
+        second = self._create('0.20')
+        self.assertEqual(self._total(), Decimal('0.30'))
+        self._create('7.70')
+        self.assertEqual(self._total(), Decimal('8.00'))
+        first.delete()
+        second.delete()
+        self.assertEqual(DailyTimelogTotal.objects.get(user=self.user, date='20231028').total_centihours, 770)
+
+    def test_rejects_non_positive_hours(self):
+        for work_hours in ('-16.00', '0.00'):
+            serializer = TimelogSerializer(data={
+                'user': self.user.id, 'project': self.project.id,
+                'date': '20231028', 'work_hours': work_hours,
+            })
+            self.assertFalse(serializer.is_valid())
+            self.assertIn('work_hours', serializer.errors)
+
+    @override_settings(TIMELOG_MAX_HOURS_PER_DAY=8)
+    def test_update_replaces_own_hours(self):
+        timelog = self._create('6.00')
+        serializer = TimelogSerializer(timelog, data={
+            'user': self.user.id, 'project': self.project.id,
+            'date': '20231028', 'work_hours': '8.00',
+        })
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        serializer.save()
+        self.assertEqual(self._total(), Decimal('8.00'))
+
+        serializer = TimelogSerializer(timelog, data={
+            'user': self.user.id, 'project': self.project.id,
+            'date': '20231029', 'work_hours': '8.00',
+        })
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        serializer.save()
+        self.assertEqual(self._total(), Decimal('0.00'))
+        self.assertEqual(self._total('20231029'), Decimal('8.00'))
+
+    @override_settings(TIMELOG_MAX_HOURS_PER_DAY=8)
+    def test_rejected_update_keeps_total(self):
+        timelog = self._create('6.00')
+        self._create('2.00')
+        serializer = TimelogSerializer(timelog, data={
+            'user': self.user.id, 'project': self.project.id,
+            'date': '20231028', 'work_hours': '7.00',
+        })
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        with self.assertRaises(ValidationError):
+            serializer.save()
+        timelog.refresh_from_db()
+        self.assertEqual(timelog.work_hours, Decimal('6.00'))
+        self.assertEqual(self._total(), Decimal('8.00'))
+
+    def test_delete_decrements_total(self):
+        timelog = self._create('4.00')
+        self.client.force_login(self.user)
+        url = reverse('timelog-detail', kwargs={'pk': timelog.id})
+        response = self.client.delete(url, {'user': self.user.id}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(self._total(), Decimal('0.00'))
+
+    @override_settings(TIMELOG_MAX_HOURS_PER_DAY=8)
+    def test_project_delete_releases_hours(self):
+        self._create('8.00')
+        self.client.force_login(self.user)
+        response = self.client.delete(f'/track/project/{self.project.project_id}')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(Timelog.objects.exists())
+        self.assertEqual(self._total(), Decimal('0.00'))
+        self.project = Project.objects.create(project_id='CAP002', name='Cap Project 2', description='Cap Project 2')
+        self._create('1.00')
+
+    def test_rebuild_daily_totals(self):
+        self._create('4.00')
+        Timelog.objects.create(user=self.user, project=self.project, date='20231028', work_hours='0.10')
+        Timelog.objects.create(user=self.user, project=self.project, date='20231028', work_hours='0.20')
+        call_command('rebuild_daily_totals', stdout=StringIO())
+        self.assertEqual(DailyTimelogTotal.objects.get(user=self.user, date='20231028').total_centihours, 430)
+
+
+class ProjectSearchTestCase(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='searchuser', password='testpass')
+        self.client.force_login(self.user)
+        Project.objects.create(project_id='TIME-01', name='Billing portal', description='Invoices for customers')
+        Project.objects.create(project_id='OPS-02', name='Timesheet importer', description='Imports legacy data')
+        Project.objects.create(project_id='OPS-03', name='Payroll', description='Monthly timesheet export')
+
+    def _search(self, query, **params):
+        response = self.client.get(reverse('project-search'), {'q': query, **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_project_id_prefix_ranks_first(self):
+        data = self._search('time')
+        self.assertEqual(data['count'], 3)
+        self.assertEqual(data['results'][0]['project_id'], 'TIME-01')
+        self.assertEqual({row['project_id'] for row in data['results']}, {'TIME-01', 'OPS-02', 'OPS-03'})
+
+    def test_search_is_paginated(self):
+        data = self._search('ops', limit=1, offset=1)
+        self.assertEqual(data['count'], 2)
+        self.assertEqual([row['project_id'] for row in data['results']], ['OPS-03'])
+
+    def test_search_index_follows_updates_and_deletes(self):
+        Project.objects.filter(project_id='OPS-03').update(name='Ledger', description='Accounts')
+        Project.objects.filter(project_id='OPS-02').delete()
+        self.assertEqual(self._search('timesheet')['count'], 0)
+        self.assertEqual(self._search('ledg')['results'][0]['project_id'], 'OPS-03')
+
+    def test_search_is_a_reserved_project_id(self):
+        response = self.client.post('/track/project', {'name': 'S', 'description': 'S', 'project_id': 'search'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('project_id', response.data)
+        self.assertFalse(Project.objects.filter(project_id='search').exists())
+
+    def test_search_limit_is_capped(self):
+        Project.objects.bulk_create(
+            Project(project_id=f'BULK-{i}', name='Bulk', description='Bulk') for i in range(120)
+        )
+        data = self._search('bulk', limit=1000000)
+        self.assertEqual(data['count'], 120)
+        self.assertEqual(len(data['results']), 100)
+
+    @skipUnless(connection.vendor == 'sqlite', 'FTS5 search only runs on SQLite')
+    def test_search_sync_triggers_exist(self):
+        # Django remakes SQLite tables on most Project AlterFields, which drops the FTS sync triggers
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = %s", [Project._meta.db_table])
+            triggers = {row[0] for row in cursor.fetchall()}
+        self.assertEqual(triggers, {
+            'timelogs_project_fts_insert', 'timelogs_project_fts_update', 'timelogs_project_fts_delete',
+        })
+
+    def test_fallback_search(self):
+        results = fallback_search_projects('ops')
+        self.assertEqual([project.project_id for project in results], ['OPS-02', 'OPS-03'])
+
+    def test_search_requires_query(self):
+        response = self.client.get(reverse('project-search'), {'q': ' '})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class WarmupTestCase(APITestCase):
+    def test_warm_up_runs_every_step(self):
+        timings = warm_up()
+        self.assertEqual(list(timings), ['urls', 'serializers', 'database', 'content_types'])
+
+    def test_warm_up_skips_database_for_asgi(self):
+        self.assertNotIn('database', warm_up(database=False))
+
+    def test_warm_up_survives_failing_step(self):
+        with mock.patch('timelogs.warmup.ContentType.objects.get_for_models', side_effect=DatabaseError('no such table')):
+            with self.assertLogs('timelogs.warmup', level='ERROR'):
+                timings = warm_up()
+        self.assertEqual(list(timings), ['urls', 'serializers', 'database', 'content_types'])
+        self.assertIsNone(timings['content_types'])
+
+    def test_warm_up_does_not_create_missing_database(self):
+        missing = os.path.join(tempfile.mkdtemp(), 'missing.sqlite3')
+        with mock.patch.dict(connection.settings_dict, {'NAME': missing, 'CONN_MAX_AGE': 60}):
+            with self.assertRaises(DatabaseError):
+                check_database(connection)
+        self.assertFalse(os.path.exists(missing))
+
+    def test_parse_import_times(self):
+        output = (
+            'import time: self [us] | cumulative | imported package\n'
+            'import time:       120 |        450 |   django.conf\n'
+            'import time:        80 |         80 | timelogs\n'
+        )
+        self.assertEqual(parse_import_times(output), [('django.conf', 120, 450), ('timelogs', 80, 80)])
@@ -1,9 +1,10 @@
 from django.urls import path
-from .views import ProjectView, ProjectDetail, TimelogView, TimelogDetail, UserProfileView
+from .views import ProjectView, ProjectSearchView, ProjectDetail, TimelogView, TimelogDetail, UserProfileView
 urlpatterns = [
     path('project', ProjectView.as_view()),
+    path('project/search', ProjectSearchView.as_view(), name='project-search'),
     path('project/<str:project_id>', ProjectDetail.as_view()),
     path('timelog', TimelogView.as_view(), name='timelogs'),
-    path('timelogdetail', TimelogDetail.as_view(), name='timelog-detail'),
+    path('timelogdetail/<int:pk>', TimelogDetail.as_view(), name='timelog-detail'),
     path('tag', UserProfileView.as_view()),
-]
\ No newline at end of file
+]
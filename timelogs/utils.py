@@ -1,5 +1,11 @@
+from decimal import Decimal
+from django.conf import settings
 from rest_framework.permissions import BasePermission
 from django.contrib.auth.models import User
+from django.db.models import F, IntegerField, Sum
+from django.db.models.functions import Cast, Round
+from rest_framework.exceptions import ValidationError
+from .models import DailyTimelogTotal
 
 class IsOwner(BasePermission):
     """
@@ -8,4 +14,42 @@ class IsOwner(BasePermission):
     def has_object_permission(self, request, view, obj):
         #check user is editing his own record
         # Write permissions are only allowed to the owner of the object.
-        return request.user == request.data.get('user')
\ No newline at end of file
+        return request.user == request.data.get('user')
+
+def to_centihours(hours):
+    """
+    Converts hours (up to 2 decimal places) to whole hundredths of an hour
+    """
+    return int((Decimal(hours) * 100).to_integral_value())
+
+def daily_centihours(timelogs):
+    """
+    Returns (user_id, date, total) rows for the given Timelog queryset, totals in hundredths of an hour.
+    Each row is rounded to an integer before summing so SQLite's REAL storage does not leak into the totals.
+    """
+    return timelogs.values('user_id', 'date').annotate(
+        total=Sum(Cast(Round(F('work_hours') * 100), IntegerField()))
+    )
+
+def add_daily_hours(user_id, date, hours):
+    """
+    Adds hours to the user's total for the given date, refusing to go over TIMELOG_MAX_HOURS_PER_DAY.
+    The cap check and the increment are one conditional UPDATE, so concurrent writes cannot both pass it.
+    Must be called inside the same transaction as the Timelog write it mirrors.
+    """
+    cap = settings.TIMELOG_MAX_HOURS_PER_DAY
+    centihours = to_centihours(hours)
+    DailyTimelogTotal.objects.get_or_create(user_id=user_id, date=date)
+    updated = DailyTimelogTotal.objects.filter(
+        user_id=user_id, date=date, total_centihours__lte=to_centihours(cap) - centihours
+    ).update(total_centihours=F('total_centihours') + centihours)
+    if not updated:
+        raise ValidationError({'work_hours': [f'User cannot log more than {cap} hours on {date}']})
+
+def remove_daily_hours(user_id, date, hours):
+    """
+    Subtracts hours from the user's total for the given date.
+    """
+    DailyTimelogTotal.objects.filter(user_id=user_id, date=date).update(
+        total_centihours=F('total_centihours') - to_centihours(hours)
+    )
@@ -1,11 +1,14 @@
 from django.contrib.auth.models import User
+from django.db import transaction
 from rest_framework.authentication import SessionAuthentication, BasicAuthentication
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework import status
 from rest_framework.exceptions import ValidationError, NotFound, NotAcceptable
+from rest_framework.pagination import LimitOffsetPagination
 from .models import Project, Timelog, UserProfile
+from .search import search_projects
 
 from .serializers import ProjectSerializer, TimelogSerializer, UserProfileSerializer
 
@@ -44,9 +47,47 @@ If a Project with the same project_id already exists, a ValidationError is raise
             serializer.is_valid(raise_exception=True)
             serializer.save()
             return Response(serializer.data)
+        except ValidationError:
+            raise
         except Exception as e:
             raise ValidationError(f'Project is already present with project ID: {request.data.get("project_id")}')
         
+class ProjectSearchPagination(LimitOffsetPagination):
+    """
+    Caps the page size so a large limit cannot download the whole catalog
+    """
+    default_limit = 20
+    max_limit = 100
+
+class ProjectSearchView(APIView):
+    """
+This APIView allows authenticated users to search Project objects without downloading the whole catalog.
+
+Authentication:
+SessionAuthentication: Uses Django session authentication for authentication
+BasicAuthentication: Uses basic authentication for authentication
+
+Permissions:
+IsAuthenticated: Only authenticated users can access this API.
+
+GET request:
+Takes the search text in the q query parameter.
+Returns Projects whose project_id starts with q first, then Projects whose name or description match q, best match first.
+Results are paginated with the limit (default 20, at most 100) and offset query parameters.
+If q is missing or blank, a ValidationError is raised.
+"""
+    authentication_classes = [SessionAuthentication, BasicAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        query = request.query_params.get('q', '').strip()
+        if not query:
+            raise ValidationError('Search text is required in the q parameter')
+        paginator = ProjectSearchPagination()
+        page = paginator.paginate_queryset(search_projects(query), request, view=self)
+        serializer = ProjectSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
+
 class ProjectDetail(APIView):
     """
 This APIView class allows authenticated users to retrieve, update, and delete Project objects by their project_id.
@@ -156,6 +197,8 @@ If there is any error during validation or saving of the new Timelog object, a V
                 serializer.is_valid(raise_exception=True)
                 serializer.save()
                 return Response(serializer.data)
+        except ValidationError as e:
+            raise ValidationError({'error': e.detail, 'data': request.data})
         except Exception as e:
             raise ValidationError({'error': str(e), 'data': request.data})
 
@@ -204,6 +247,8 @@ If the user is not authorized or the timelog id is not found, a ValidationError
                 serializer.is_valid(raise_exception=True)
                 serializer.save()
                 return Response(serializer.data)
+        except ValidationError as e:
+            raise ValidationError({'error': e.detail, 'data': request.data})
         except Exception as e:
             raise ValidationError({'error': str(e), 'data': request.data})
     
@@ -214,8 +259,8 @@ If the user is not authorized or the timelog id is not found, a ValidationError
                 raise NotAcceptable(f'You can only delete your own timelogs')
             
             else:
-                timelog = Timelog.objects.get(id=pk)
-                Timelog.objects.get(id=pk).delete()
+                with transaction.atomic():
+                    Timelog.objects.select_for_update().get(id=pk).delete()
                 return Response({"message":"success"}, status=status.HTTP_204_NO_CONTENT)
         except Exception as e:
             raise ValidationError({'error': str(e), 'data': request.data})
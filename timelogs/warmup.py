@@ -0,0 +1,99 @@
+import logging
+import os
+import time
+from django.contrib.contenttypes.models import ContentType
+from django.db import DatabaseError, connections, router
+from django.urls import get_resolver, resolve
+from .models import DailyTimelogTotal, Project, Timelog, UserProfile
+from .serializers import ProjectSerializer, TimelogSerializer, UserProfileSerializer
+from . import urls
+
+logger = logging.getLogger(__name__)
+
+
+def warm_urls():
+    """
+    Compiles every URL pattern and resolves the static /track/ routes once
+    """
+    get_resolver().reverse_dict
+    for pattern in urls.urlpatterns:
+        route = str(pattern.pattern)
+        if '<' not in route:
+            resolve(f'/track/{route}')
+
+
+def warm_serializers():
+    """
+    Builds the serializer fields so the DRF field classes and model introspection are loaded
+    """
+    for serializer_class in (ProjectSerializer, TimelogSerializer, UserProfileSerializer):
+        serializer_class().fields
+
+
+def check_database(connection):
+    """
+    Raises DatabaseError if the SQLite database file does not exist yet, instead of letting the
+    connection attempt create an empty one
+    """
+    name = connection.settings_dict['NAME']
+    if connection.vendor == 'sqlite' and not connection.creation.is_in_memory_db(name) and not os.path.exists(name):
+        raise DatabaseError(f'Database {name} does not exist, run manage.py migrate')
+
+
+def warm_database():
+    """
+    Opens a connection for every database with CONN_MAX_AGE > 0.
+    Django connections are per thread, so this only helps sync WSGI workers, where requests run on
+    the thread that imported the application. Threaded (gthread) and ASGI workers never reuse it,
+    and with CONN_MAX_AGE = 0 it would be closed when the first request starts.
+    """
+    for connection in connections.all():
+        if connection.settings_dict['CONN_MAX_AGE']:
+            check_database(connection)
+            connection.ensure_connection()
+
+
+def warm_content_types():
+    """
+    Fills the ContentType cache that permission checks read
+    """
+    connection = connections[router.db_for_read(ContentType)]
+    check_database(connection)
+    if ContentType._meta.db_table not in connection.introspection.table_names():
+        raise DatabaseError(f'{ContentType._meta.db_table} table does not exist, run manage.py migrate')
+    ContentType.objects.get_for_models(Project, Timelog, UserProfile, DailyTimelogTotal)
+
+
+WARMUP_STEPS = [
+    ('urls', warm_urls),
+    ('serializers', warm_serializers),
+    ('database', warm_database),
+    ('content_types', warm_content_types),
+]
+
+
+def warm_up(database=True):
+    """
+    Runs every warm-up step and returns the time each took in seconds, or None for a step that failed.
+    A failing step is logged and the remaining steps still run, so the worker boots even when the
+    database is down or not migrated yet.
+    Called from wsgi.py/asgi.py at worker boot when WARMUP_ON_BOOT is set; asgi.py passes database=False.
+    With gunicorn --preload, call it from the post_worker_init hook instead so DB connections are not
+    shared across forks.
+    """
+    timings = {}
+    for name, step in WARMUP_STEPS:
+        if name == 'database' and not database:
+            continue
+        start = time.perf_counter()
+        try:
+            step()
+        except Exception:
+            logger.exception('Worker warm-up step %s failed', name)
+            timings[name] = None
+            continue
+        timings[name] = time.perf_counter() - start
+    logger.info('Worker warm-up finished: %s', ', '.join(
+        f'{name} FAILED' if seconds is None else f'{name} {seconds * 1000:.1f} ms' for name, seconds in timings.items()
+    ))
+    return timings